@@ -6,7 +6,14 @@ Parses JMeter JTL results files and fails the CI/CD pipeline if
 performance thresholds are breached.
 
 USAGE:
+    pip install -r perf-tests/scripts/requirements.txt
     python3 check-perf-thresholds.py results.jtl [--config thresholds.json]
+        [--engine auto|pyarrow|pandas|stdlib] [--jobs N]
+
+PARSING:
+- --engine auto (default) reads files under 1 MB with the standard library
+  and larger files with pyarrow if installed, otherwise pandas
+- --jobs sets the threads used for per-sampler percentiles (0 = all CPUs)
 
 HOW TO CUSTOMIZE THRESHOLDS:
 1. Edit the DEFAULT_THRESHOLDS dict below, OR
@@ -25,12 +32,67 @@ EXIT CODES:
 - 2: Error parsing results file
 """
 
+import argparse
+import array
 import csv
-import json
+import importlib.util
+import operator
+import os
 import sys
-import statistics
-from pathlib import Path
-from collections import defaultdict
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# The only JTL columns compute_metrics reads; the parsers skip the rest
+JTL_COLUMNS = ['timeStamp', 'elapsed', 'label', 'success']
+JTL_DTYPES = {
+    'timeStamp': 'int64',
+    'elapsed': 'int32',
+    'label': 'category',
+    'success': 'category',
+}
+
+# Values for columns a JTL was saved without, as the CSV text JMeter would
+# have written (JMeter's save service can drop any of them, e.g. success)
+JTL_DEFAULTS = {
+    'timeStamp': '0',
+    'elapsed': '0',
+    'label': '',
+    'success': 'false',
+}
+
+# JTL readers selectable with --engine; 'auto' picks by file size
+JTL_ENGINES = ('auto', 'pyarrow', 'pandas', 'stdlib')
+
+# Below this size the csv module parses faster than pandas/pyarrow can import
+SMALL_JTL_BYTES = 1_000_000
+
+# Per-sampler percentiles reported alongside the median
+PERCENTILES = (90, 95, 99)
+
+# Per-label percentiles run on a thread pool above this many labels; numpy
+# releases the GIL while sorting and partitioning
+PARALLEL_MIN_LABELS = 8
+
+# Up to this size a full np.sort is cheaper than selecting ranks one by one
+SORT_MAX_SAMPLES = 4096
+
+# Metrics for one sampler (or __overall__); unset fields read as 0, except
+# median_ms and p90_ms, which __overall__ leaves as None
+Metric = namedtuple(
+    'Metric',
+    'count avg_ms min_ms max_ms median_ms p90_ms p95_ms p99_ms '
+    'error_count error_rate_pct throughput_rps',
+    defaults=(0,) * 11,
+)
+
+# (threshold key, Metric field, description) for the response time limits
+CHECKS = (
+    ('max_avg_response_ms', 'avg_ms', 'Average response time'),
+    ('max_p95_response_ms', 'p95_ms', '95th percentile response time'),
+    ('max_p99_response_ms', 'p99_ms', '99th percentile response time'),
+)
 
 DEFAULT_THRESHOLDS = {
     "max_avg_response_ms": 500,
@@ -52,101 +114,323 @@ DEFAULT_THRESHOLDS = {
 }
 
 
-def parse_jtl(filepath: str) -> list[dict]:
-    """Parse a JMeter JTL (CSV format) results file."""
-    results = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            results.append({
-                'timestamp': int(row.get('timeStamp', 0)),
-                'elapsed': int(row.get('elapsed', 0)),
-                'label': row.get('label', ''),
-                'responseCode': row.get('responseCode', ''),
-                'success': row.get('success', 'false').lower() == 'true',
-                'bytes': int(row.get('bytes', 0)),
-                'latency': int(row.get('Latency', 0)),
-                'connect': int(row.get('Connect', 0)),
-            })
-    return results
-
-
-def compute_metrics(results: list[dict]) -> dict:
-    """Compute aggregate performance metrics."""
-    if not results:
+def parse_jtl(filepath: str, engine: str = 'auto') -> dict:
+    """
+    Parse a JMeter JTL (CSV format) results file into column arrays.
+
+    Returns equal-length 'timestamp', 'elapsed', 'success' and 'label'
+    arrays, where 'label' holds integer codes into the 'labels' array.
+    """
+    size = os.path.getsize(filepath)
+    if size == 0:
+        return _fill_missing_columns({}, 0)
+
+    if engine == 'auto':
+        if size < SMALL_JTL_BYTES:
+            engine = 'stdlib'
+        elif importlib.util.find_spec('pyarrow') is not None:
+            engine = 'pyarrow'
+        else:
+            engine = 'pandas'
+
+    if engine == 'stdlib':
+        return _read_jtl_stdlib(filepath)
+    if engine == 'pyarrow':
+        return _read_jtl_arrow(filepath)
+    return _read_jtl_pandas(filepath)
+
+
+def _fill_missing_columns(columns: dict, rows: int) -> dict:
+    """Add the JTL_DEFAULTS value for every column the file did not have."""
+    if 'timestamp' not in columns:
+        columns['timestamp'] = np.full(rows, int(JTL_DEFAULTS['timeStamp']), dtype=np.int64)
+    if 'elapsed' not in columns:
+        columns['elapsed'] = np.full(rows, int(JTL_DEFAULTS['elapsed']), dtype=np.int32)
+    if 'success' not in columns:
+        columns['success'] = np.full(rows, _success_flags([JTL_DEFAULTS['success']])[0])
+    if 'label' not in columns:
+        columns['label'] = np.zeros(rows, dtype=np.int32)
+        columns['labels'] = np.array([JTL_DEFAULTS['label']], dtype=object)
+    return columns
+
+
+def _success_flags(values) -> np.ndarray:
+    """Flag each distinct success value; anything but 'true' in any case is a failure."""
+    return np.array([value.lower() == 'true' for value in values], dtype=bool)
+
+
+def _read_jtl_stdlib(filepath: str) -> dict:
+    """Read a small JTL file by splitting its raw bytes, without pandas."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    lines = data.splitlines()
+    header = [field.decode() for field in next(_split_jtl_records(lines[:1]), [])]
+    present = [header.index(col) for col in JTL_COLUMNS if col in header]
+    width = max(present, default=-1) + 1
+    # The schema is fixed for the whole file, so rows are split only as far
+    # as the last column we read and unpacked by one C-level itemgetter
+    records = _split_jtl_records(lines[1:], width)
+    missing = [col for col in JTL_COLUMNS if col not in header]
+    if missing:
+        # Absent columns are read from default fields appended to each row
+        pad = [JTL_DEFAULTS[col].encode() for col in missing]
+        records = (row[:width] + pad for row in records)
+    positions = [header.index(col) if col in header else width + missing.index(col)
+                 for col in JTL_COLUMNS]
+    pick = operator.itemgetter(*positions)
+
+    # Packed typed arrays grow without boxing every value into a list
+    timestamps = array.array('q')
+    elapsed = array.array('i')
+    success = array.array('i')
+    codes = array.array('i')
+    success_codes = {}
+    label_codes = {}
+
+    for row in records:
+        ts, el, label, ok = pick(row)
+        timestamps.append(int(ts))
+        elapsed.append(int(el))
+        success.append(success_codes.setdefault(ok, len(success_codes)))
+        codes.append(label_codes.setdefault(label, len(label_codes)))
+
+    # Success values are coded like labels and mapped to flags once each
+    flags = _success_flags([ok.decode() for ok in success_codes])
+    return {
+        'timestamp': np.frombuffer(timestamps, dtype=np.int64),
+        'elapsed': np.frombuffer(elapsed, dtype=np.intc),
+        'success': flags[np.frombuffer(success, dtype=np.intc)],
+        'label': np.frombuffer(codes, dtype=np.intc),
+        'labels': np.array([label.decode() for label in label_codes], dtype=object),
+    }
+
+
+def _split_jtl_records(lines: list, maxsplit: int = -1):
+    """Yield the byte fields of each JTL record; only quoted lines go through csv."""
+    lines = iter(lines)
+    for line in lines:
+        if not line:
+            continue
+        if b'"' not in line:
+            yield line.split(b',', maxsplit)
+            continue
+        # Quoted fields may hold commas or run over several lines
+        while line.count(b'"') % 2:
+            more = next(lines, None)
+            if more is None:
+                break
+            line += b'\n' + more
+        yield [field.encode() for field in next(csv.reader([line.decode()]))]
+
+
+def _read_jtl_arrow(filepath: str) -> dict:
+    """Read a JTL file with pyarrow's multi-threaded CSV reader."""
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    with open(filepath, newline='') as f:
+        header = next(csv.reader(f), [])
+    present = [col for col in JTL_COLUMNS if col in header]
+
+    table = pacsv.read_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(block_size=16 << 20, use_threads=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=present,
+            column_types={
+                'timeStamp': pa.int64(),
+                'elapsed': pa.int32(),
+                'success': pa.dictionary(pa.int32(), pa.string()),
+                'label': pa.dictionary(pa.int32(), pa.string()),
+            },
+        ),
+    )
+    # Blocks may carry their own label and success dictionaries; unify them
+    # so the combined indices all point into one array of values
+    table = table.unify_dictionaries()
+    columns = {}
+    if 'timeStamp' in present:
+        columns['timestamp'] = _arrow_values(table.column('timeStamp').combine_chunks(), np.int64)
+    if 'elapsed' in present:
+        columns['elapsed'] = _arrow_values(table.column('elapsed').combine_chunks(), np.int32)
+    if 'success' in present:
+        ok = table.column('success').combine_chunks()
+        flags = _success_flags(ok.dictionary.to_pylist())
+        columns['success'] = flags[_arrow_values(ok.indices, np.int32)]
+    if 'label' in present:
+        label = table.column('label').combine_chunks()
+        columns['label'] = _arrow_values(label.indices, np.int32)
+        columns['labels'] = np.array(label.dictionary.to_pylist(), dtype=object)
+    return _fill_missing_columns(columns, table.num_rows)
+
+
+# Arrow's own to_numpy() imports pandas whenever it is installed, so the
+# Arrow engine reads the column buffers directly instead
+
+def _arrow_values(arr, dtype) -> np.ndarray:
+    """Zero-copy NumPy view of a primitive Arrow array without nulls."""
+    if arr.null_count:
+        raise ValueError(f"{arr.null_count} empty {arr.type} values in JTL column")
+    return np.frombuffer(arr.buffers()[1], dtype=dtype, count=len(arr),
+                         offset=arr.offset * np.dtype(dtype).itemsize)
+
+
+def _read_jtl_pandas(filepath: str) -> dict:
+    """Read a JTL file with pandas' C parser."""
+    import pandas as pd
+
+    df = pd.read_csv(
+        filepath,
+        engine='c',
+        usecols=lambda col: col in JTL_COLUMNS,
+        dtype=JTL_DTYPES,
+        # Labels such as 'NA' or 'null' are sampler names, not missing values
+        na_filter=False,
+        low_memory=False,
+    )
+    columns = {}
+    if 'timeStamp' in df:
+        columns['timestamp'] = df['timeStamp'].to_numpy()
+    if 'elapsed' in df:
+        columns['elapsed'] = df['elapsed'].to_numpy()
+    if 'success' in df:
+        ok = df['success']
+        flags = _success_flags(ok.cat.categories)
+        columns['success'] = flags[ok.cat.codes.to_numpy()]
+    if 'label' in df:
+        label = df['label']
+        columns['label'] = label.cat.codes.to_numpy(dtype=np.int32)
+        columns['labels'] = label.cat.categories.to_numpy(dtype=object)
+    return _fill_missing_columns(columns, len(df))
+
+
+def compute_metrics(results: dict, jobs: int = 0) -> dict:
+    """Compute aggregate performance metrics (jobs=0 uses every CPU)."""
+    elapsed = results['elapsed']
+    timestamps = results['timestamp']
+    success = results['success']
+    codes = results['label']
+    labels = results['labels']
+    if not len(elapsed):
         return {}
 
-    # Group by sampler label
-    by_label = defaultdict(list)
-    for r in results:
-        by_label[r['label']].append(r)
+    # Per-label totals straight from the label codes
+    counts = np.bincount(codes, minlength=len(labels))
+    elapsed_sums = np.bincount(codes, weights=elapsed, minlength=len(labels))
+    error_counts = np.bincount(codes[~success], minlength=len(labels))
+
+    # A stable sort on the codes lays each label's samples out contiguously,
+    # so min/max become segment reductions and percentiles work on slices
+    order = np.argsort(codes, kind='stable')
+    elapsed_by_label = elapsed[order]
+    timestamps_by_label = timestamps[order]
+    present = np.flatnonzero(counts)
+    starts = (np.cumsum(counts) - counts)[present]
+    min_ms = np.minimum.reduceat(elapsed_by_label, starts)
+    max_ms = np.maximum.reduceat(elapsed_by_label, starts)
+    first_ts = np.minimum.reduceat(timestamps_by_label, starts)
+    last_ts = np.maximum.reduceat(timestamps_by_label, starts)
+
+    groups = [elapsed_by_label[start:start + counts[code]] for start, code in zip(starts, present)]
+    if jobs != 1 and len(groups) > PARALLEL_MIN_LABELS:
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            group_stats = list(pool.map(compute_group_stats, groups))
+    else:
+        group_stats = [compute_group_stats(samples) for samples in groups]
 
     metrics = {}
-    for label, samples in by_label.items():
-        elapsed_times = sorted([s['elapsed'] for s in samples])
-        error_count = sum(1 for s in samples if not s['success'])
-        total = len(samples)
+    for i, code in enumerate(present):
+        total = int(counts[code])
+        median, ranked = group_stats[i]
+        error_count = int(error_counts[code])
 
         # Calculate time range for throughput
-        timestamps = [s['timestamp'] for s in samples]
-        duration_sec = (max(timestamps) - min(timestamps)) / 1000.0 if len(timestamps) > 1 else 1.0
-
-        metrics[label] = {
-            'count': total,
-            'avg_ms': statistics.mean(elapsed_times),
-            'min_ms': min(elapsed_times),
-            'max_ms': max(elapsed_times),
-            'median_ms': statistics.median(elapsed_times),
-            'p90_ms': percentile(elapsed_times, 90),
-            'p95_ms': percentile(elapsed_times, 95),
-            'p99_ms': percentile(elapsed_times, 99),
-            'error_count': error_count,
-            'error_rate_pct': (error_count / total * 100) if total > 0 else 0,
-            'throughput_rps': total / duration_sec if duration_sec > 0 else 0,
-        }
+        duration_sec = (last_ts[i] - first_ts[i]) / 1000.0 if total > 1 else 1.0
+
+        metrics[labels[code]] = Metric(
+            count=total,
+            avg_ms=elapsed_sums[code] / total,
+            min_ms=min_ms[i],
+            max_ms=max_ms[i],
+            median_ms=median,
+            **{f'p{p}_ms': value for p, value in zip(PERCENTILES, ranked)},
+            error_count=error_count,
+            error_rate_pct=error_count / total * 100,
+            throughput_rps=total / duration_sec if duration_sec > 0 else 0,
+        )
 
-    # Overall metrics
-    all_elapsed = sorted([r['elapsed'] for r in results])
-    all_errors = sum(1 for r in results if not r['success'])
-    all_timestamps = [r['timestamp'] for r in results]
-    total_duration = (max(all_timestamps) - min(all_timestamps)) / 1000.0 if len(all_timestamps) > 1 else 1.0
-
-    metrics['__overall__'] = {
-        'count': len(results),
-        'avg_ms': statistics.mean(all_elapsed),
-        'p95_ms': percentile(all_elapsed, 95),
-        'p99_ms': percentile(all_elapsed, 99),
-        'error_count': all_errors,
-        'error_rate_pct': (all_errors / len(results) * 100),
-        'throughput_rps': len(results) / total_duration,
-    }
+    # Overall metrics; everything but the percentiles folds the per-label
+    # totals, and the percentiles select straight from the unsorted column
+    total = len(elapsed)
+    all_pcts = multi_pct(elapsed, (95, 99))
+    all_errors = int(error_counts.sum())
+    total_duration = (last_ts.max() - first_ts.min()) / 1000.0 if total > 1 else 1.0
+
+    metrics['__overall__'] = Metric(
+        count=total,
+        avg_ms=elapsed_sums.sum() / total,
+        min_ms=min_ms.min(),
+        max_ms=max_ms.max(),
+        median_ms=None,
+        p90_ms=None,
+        p95_ms=all_pcts[95],
+        p99_ms=all_pcts[99],
+        error_count=all_errors,
+        error_rate_pct=(all_errors / total * 100),
+        throughput_rps=total / total_duration if total_duration > 0 else 0,
+    )
 
     return metrics
 
 
-def percentile(sorted_data: list, pct: int) -> float:
-    """Calculate percentile from sorted data."""
-    if not sorted_data:
-        return 0
-    idx = int(len(sorted_data) * pct / 100)
-    return sorted_data[min(idx, len(sorted_data) - 1)]
+def compute_group_stats(samples: np.ndarray) -> tuple:
+    """Median and PERCENTILES of one label's elapsed times."""
+    total = len(samples)
+    ks = np.concatenate(([(total - 1) // 2, total // 2], pct_ranks(total, PERCENTILES)))
+    mid_lo, mid_hi, *ranked = order_stats(samples, ks)
+    return (mid_lo + mid_hi) / 2, ranked
+
+
+def multi_pct(arr: np.ndarray, pcts) -> dict:
+    """Read several nearest-rank percentiles of arr in one pass."""
+    return dict(zip(pcts, order_stats(arr, pct_ranks(len(arr), pcts))))
+
+
+def pct_ranks(n: int, pcts) -> np.ndarray:
+    """Nearest-rank indices of pcts within n sorted samples."""
+    return np.clip((n * np.asarray(pcts) / 100).astype(np.intp), 0, n - 1)
+
+
+def order_stats(arr: np.ndarray, ks: np.ndarray) -> np.ndarray:
+    """Values at the given 0-based sorted ranks of arr."""
+    if len(arr) <= SORT_MAX_SAMPLES:
+        return np.sort(arr)[ks]
+
+    # Select ascending ranks one at a time, each on the tail left by the
+    # previous one; single-kth partitions are much cheaper than one
+    # multi-kth np.partition call
+    kth = np.unique(ks)
+    values = np.empty(len(kth), dtype=arr.dtype)
+    part = arr.copy()
+    base = 0
+    for j, k in enumerate(kth):
+        tail = part[base:]
+        tail.partition(k - base)
+        values[j] = tail[k - base]
+        base = k
+    return values[np.searchsorted(kth, ks)]
 
 
 def check_thresholds(metrics: dict, thresholds: dict) -> list[str]:
     """Check metrics against thresholds. Returns list of violations."""
     violations = []
-    overall = metrics.get('__overall__', {})
+    overall = metrics.get('__overall__', Metric())
 
     # Global thresholds
-    checks = [
-        ('max_avg_response_ms', 'avg_ms', 'Average response time'),
-        ('max_p95_response_ms', 'p95_ms', '95th percentile response time'),
-        ('max_p99_response_ms', 'p99_ms', '99th percentile response time'),
-    ]
-
-    for threshold_key, metric_key, label in checks:
+    for threshold_key, metric_key, label in CHECKS:
         limit = thresholds.get(threshold_key)
-        actual = overall.get(metric_key, 0)
+        actual = getattr(overall, metric_key)
         if limit and actual > limit:
             violations.append(
                 f"FAIL: {label} = {actual:.1f}ms (threshold: {limit}ms)"
@@ -154,7 +438,7 @@ def check_thresholds(metrics: dict, thresholds: dict) -> list[str]:
 
     # Error rate
     max_error = thresholds.get('max_error_rate_pct', 100)
-    actual_error = overall.get('error_rate_pct', 0)
+    actual_error = overall.error_rate_pct
     if actual_error > max_error:
         violations.append(
             f"FAIL: Error rate = {actual_error:.2f}% (threshold: {max_error}%)"
@@ -162,7 +446,7 @@ def check_thresholds(metrics: dict, thresholds: dict) -> list[str]:
 
     # Throughput
     min_tps = thresholds.get('min_throughput_rps', 0)
-    actual_tps = overall.get('throughput_rps', 0)
+    actual_tps = overall.throughput_rps
     if min_tps and actual_tps < min_tps:
         violations.append(
             f"FAIL: Throughput = {actual_tps:.1f} rps (minimum: {min_tps} rps)"
@@ -171,13 +455,13 @@ def check_thresholds(metrics: dict, thresholds: dict) -> list[str]:
     # Per-sampler thresholds
     sampler_thresholds = thresholds.get('samplers', {})
     for sampler_name, sampler_limits in sampler_thresholds.items():
-        sampler_metrics = metrics.get(sampler_name, {})
-        if not sampler_metrics:
+        sampler_metrics = metrics.get(sampler_name)
+        if sampler_metrics is None:
             continue
 
-        for threshold_key, metric_key, label in checks:
+        for threshold_key, metric_key, label in CHECKS:
             limit = sampler_limits.get(threshold_key)
-            actual = sampler_metrics.get(metric_key, 0)
+            actual = getattr(sampler_metrics, metric_key)
             if limit and actual > limit:
                 violations.append(
                     f"FAIL: [{sampler_name}] {label} = {actual:.1f}ms (threshold: {limit}ms)"
@@ -188,55 +472,57 @@ def check_thresholds(metrics: dict, thresholds: dict) -> list[str]:
 
 def print_report(metrics: dict):
     """Print a formatted performance report."""
-    print("\n" + "=" * 70)
-    print("PERFORMANCE TEST RESULTS")
-    print("=" * 70)
+    # Collected and written once rather than one print() call per line
+    lines = ["", "=" * 70, "PERFORMANCE TEST RESULTS", "=" * 70]
 
     for label, m in sorted(metrics.items()):
-        if label == '__overall__':
-            print(f"\n{'OVERALL':}")
-        else:
-            print(f"\n{label}:")
-
-        print(f"  Requests:    {m['count']}")
-        print(f"  Avg:         {m['avg_ms']:.1f}ms")
-        if 'median_ms' in m:
-            print(f"  Median:      {m['median_ms']:.1f}ms")
-        print(f"  P95:         {m['p95_ms']:.1f}ms")
-        print(f"  P99:         {m['p99_ms']:.1f}ms")
-        print(f"  Errors:      {m['error_count']} ({m['error_rate_pct']:.2f}%)")
-        print(f"  Throughput:  {m['throughput_rps']:.1f} req/s")
+        lines.append("")
+        lines.append("OVERALL" if label == '__overall__' else f"{label}:")
+        lines.append(f"  Requests:    {m.count}")
+        lines.append(f"  Avg:         {m.avg_ms:.1f}ms")
+        if m.median_ms is not None:
+            lines.append(f"  Median:      {m.median_ms:.1f}ms")
+        lines.append(f"  P95:         {m.p95_ms:.1f}ms")
+        lines.append(f"  P99:         {m.p99_ms:.1f}ms")
+        lines.append(f"  Errors:      {m.error_count} ({m.error_rate_pct:.2f}%)")
+        lines.append(f"  Throughput:  {m.throughput_rps:.1f} req/s")
 
-    print("\n" + "=" * 70)
+    lines.extend(["", "=" * 70, ""])
+    sys.stdout.write("\n".join(lines))
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: check-perf-thresholds.py <results.jtl> [--config thresholds.json]")
-        sys.exit(2)
-
-    jtl_file = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="Fail the pipeline when JMeter results breach performance thresholds.")
+    parser.add_argument('jtl_file', help="JMeter JTL results file (CSV format)")
+    parser.add_argument('--config', help="JSON thresholds file (defaults to DEFAULT_THRESHOLDS)")
+    parser.add_argument('--engine', choices=JTL_ENGINES, default='auto',
+                        help="JTL reader; 'auto' picks by file size and installed packages")
+    parser.add_argument('--jobs', type=int, default=0,
+                        help="threads for per-sampler percentiles (0 = all CPUs)")
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (all CPUs) or a positive thread count")
 
     # Load thresholds
     thresholds = DEFAULT_THRESHOLDS
-    if '--config' in sys.argv:
-        config_idx = sys.argv.index('--config') + 1
-        if config_idx < len(sys.argv):
-            with open(sys.argv[config_idx]) as f:
-                thresholds = json.load(f)
+    if args.config:
+        import json
+        with open(args.config) as f:
+            thresholds = json.load(f)
 
     # Parse and analyze
     try:
-        results = parse_jtl(jtl_file)
+        results = parse_jtl(args.jtl_file, args.engine)
     except Exception as e:
         print(f"ERROR: Failed to parse JTL file: {e}")
         sys.exit(2)
 
-    if not results:
+    if not len(results['elapsed']):
         print("WARNING: No results found in JTL file")
         sys.exit(2)
 
-    metrics = compute_metrics(results)
+    metrics = compute_metrics(results, args.jobs)
     print_report(metrics)
 
     # Check thresholds
@@ -0,0 +1,139 @@
+"""
+Tests for check-perf-thresholds.py.
+
+RUN:
+    python3 -m unittest discover -s perf-tests/scripts
+"""
+
+import csv
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# The script name has hyphens, so it is loaded from its path
+_SPEC = importlib.util.spec_from_file_location(
+    'check_perf_thresholds',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'check-perf-thresholds.py'),
+)
+checker = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(checker)
+
+HEADER = b'timeStamp,elapsed,label,responseCode,responseMessage,success,URL\r\n'
+
+# Quoted commas, doubled quotes, multi-line fields, CRLF and blank lines
+ROWS = (
+    b'1000,12,Health Check,200,OK,true,http://host/health\r\n'
+    b'1001,15,"Create Order, bulk",200,OK,true,http://host/orders\r\n'
+    b'\r\n'
+    b'1002,30,Get Order,500,"Server said ""no""",false,http://host/orders/1\r\n'
+    b'1003,45,Get Order,502,"Bad gateway\r\nupstream, timed out",false,http://host/orders/2\r\n'
+    b'1004,20,"Health Check",200,"multi\nline\nmessage",true,http://host/health\n'
+    b'\n'
+    b'1005,18,Create Order,200,OK,TRUE,http://host/orders\n'
+)
+
+# Odd success cells and labels that pandas would otherwise read as missing
+ODD_ROWS = (
+    b'1006,22,NA,200,OK,True,http://host/na\n'
+    b'1007,31,None,200,OK,,http://host/none\n'
+    b'1008,14,null,200,OK,yes,http://host/null\n'
+    b'1009,27,N/A,500,Error,FALSE,http://host/na\n'
+    b'1010,19,NaN,200,OK,tRuE,http://host/nan\n'
+    b'1011,16,,200,OK,1,http://host/\n'
+    b'1012,25,NA,200,OK,true,http://host/na\n'
+)
+
+
+def csv_records(data: bytes) -> list:
+    """Reference parse: csv.reader over universal-newline text, like open(path, 'r')."""
+    text = io.StringIO(data.decode(), newline=None).read()
+    return [row for row in csv.reader(io.StringIO(text, newline='')) if row]
+
+
+class SplitJtlRecordsTest(unittest.TestCase):
+
+    def test_matches_csv_reader(self):
+        data = HEADER + ROWS
+        records = checker._split_jtl_records(data.splitlines())
+        actual = [[field.decode() for field in row] for row in records]
+        self.assertEqual(actual, csv_records(data))
+
+    def test_maxsplit_keeps_leading_fields(self):
+        data = HEADER + ROWS
+        expected = [row[:6] for row in csv_records(data)]
+        records = checker._split_jtl_records(data.splitlines(), 6)
+        actual = [[field.decode() for field in row[:6]] for row in records]
+        self.assertEqual(actual, expected)
+
+    def test_unterminated_quote_consumes_rest(self):
+        lines = [b'1,2,"open', b'still open']
+        self.assertEqual(len(list(checker._split_jtl_records(lines))), 1)
+
+
+class ReadJtlStdlibTest(unittest.TestCase):
+
+    def parse(self, data: bytes) -> dict:
+        with tempfile.NamedTemporaryFile(suffix='.jtl', delete=False) as f:
+            f.write(data)
+        self.addCleanup(os.remove, f.name)
+        return checker._read_jtl_stdlib(f.name)
+
+    def test_columns_match_csv_reader(self):
+        columns = self.parse(HEADER + ROWS)
+        rows = csv_records(HEADER + ROWS)
+        header, rows = rows[0], rows[1:]
+        ts, el, lbl, ok = (header.index(col) for col in checker.JTL_COLUMNS)
+
+        self.assertEqual(columns['timestamp'].tolist(), [int(r[ts]) for r in rows])
+        self.assertEqual(columns['elapsed'].tolist(), [int(r[el]) for r in rows])
+        self.assertEqual(columns['success'].tolist(), [r[ok].lower() == 'true' for r in rows])
+        labels = [columns['labels'][code] for code in columns['label']]
+        self.assertEqual(labels, [r[lbl] for r in rows])
+
+    def test_missing_column_uses_default(self):
+        columns = self.parse(b'timeStamp,elapsed,label\n1,5,A\n2,7,B\n')
+        self.assertEqual(columns['success'].tolist(), [False, False])
+        self.assertEqual(columns['elapsed'].tolist(), [5, 7])
+
+
+class EngineParityTest(unittest.TestCase):
+
+    def test_engines_compute_same_metrics(self):
+        with tempfile.NamedTemporaryFile(suffix='.jtl', delete=False) as f:
+            f.write(HEADER + ROWS + ODD_ROWS)
+        self.addCleanup(os.remove, f.name)
+
+        expected = checker.compute_metrics(checker.parse_jtl(f.name, 'stdlib'))
+        self.assertEqual(set(expected) - {'__overall__'},
+                         {'Health Check', 'Create Order, bulk', 'Get Order', 'Create Order',
+                          'NA', 'None', 'null', 'N/A', 'NaN', ''})
+        self.assertEqual(expected['__overall__'].error_count, 6)
+        for engine in ('pandas', 'pyarrow'):
+            with self.subTest(engine=engine):
+                if importlib.util.find_spec(engine) is None:
+                    self.skipTest(f'{engine} is not installed')
+                metrics = checker.compute_metrics(checker.parse_jtl(f.name, engine))
+                self.assertEqual(metrics, expected)
+
+
+class ComputeMetricsTest(unittest.TestCase):
+
+    def test_single_timestamp_has_zero_throughput(self):
+        columns = {
+            'timestamp': np.array([1000, 1000], dtype=np.int64),
+            'elapsed': np.array([5, 7], dtype=np.int32),
+            'success': np.array([True, True]),
+            'label': np.array([0, 0], dtype=np.int32),
+            'labels': np.array(['A'], dtype=object),
+        }
+        metrics = checker.compute_metrics(columns)
+        self.assertEqual(metrics['__overall__'].throughput_rps, 0)
+        self.assertEqual(metrics['A'].throughput_rps, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()